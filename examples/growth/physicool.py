@@ -1,4 +1,5 @@
 from xml.etree import ElementTree
+import pandas as pd
 from scipy import io as sio
 
 # To avoid having to write the full string for each XML element, I use this simple dict
@@ -26,6 +27,28 @@ CELL_DEFINITIONS_DICT = {
 }
 
 
+# All possible output variables written by PhysiCell
+DATA_LABELS = (
+    'ID',
+    'position_x', 'position_y', 'position_z',
+    'total_volume',
+    'cell_type',
+    'cycle_model', 'current_phase', 'elapsed_time_in_phase',
+    'nuclear_volume', 'cytoplasmic_volume',
+    'fluid_fraction', 'calcified_fraction',
+    'orientation_x', 'orientation_y', 'orientation_z',
+    'polarity',
+    'migration_speed',
+    'motility_vector_x', 'motility_vector_y', 'motility_vector_z',
+    'migration_bias',
+    'motility_bias_direction_x', 'motility_bias_direction_y', 'motility_bias_direction_z',
+    'persistence_time',
+    'motility_reserved'
+)
+# Row of each output variable in the cells array
+DATA_LABEL_INDEXES = {label: index for index, label in enumerate(DATA_LABELS)}
+
+
 def get_cell_xml_stem(key, definition_name='cancer'):
     """Returns the XML element name that corresponds to the passed parameter key."""
     for group, params in CELL_DEFINITIONS_DICT.items():
@@ -41,12 +64,36 @@ def get_me_xml_stem(key, substance='substrate'):
 def update_config_file(params_dict, config_path):
     """Updates configuration file with the specified input values."""
     tree = ElementTree.parse(config_path)
+    update_config_tree(params_dict, tree)
+    tree.write(config_path)
 
+
+def update_config_tree(params_dict, tree):
+    """Updates an already parsed configuration tree with the specified input values.
+
+    Use this when the same configuration file is updated many times (e.g., in a sweep):
+    parse it once, update the tree and write it before each simulation.
+    """
+    elements = get_param_elements(params_dict, tree)
     for param, value in params_dict.items():
+        elements[param].text = str(value)
+
+
+def get_param_elements(param_keys, tree):
+    """Returns a dictionary with the XML element that corresponds to each parameter key.
+
+    The returned elements can be kept and updated directly (element.text = str(value))
+    before each simulation, so that their paths are only resolved once.
+    """
+    elements = {}
+    cell_keys = []
+    for param in param_keys:
         param_type, key = param.split('/')
         # Expects the structure "cell/key}'
+        # Cell parameters are collected and found together in a single pass
         if param_type == 'cell':
-            param_name = get_cell_xml_stem(key,'cancer')
+            cell_keys.append(key)
+            continue
        # elif param_type == 'wt_cell':
         #     param_name == get_cell_xml_stem(key,'wildtype)
         # Expects the structure "me/{substance}:{key}'
@@ -56,13 +103,43 @@ def update_config_file(params_dict, config_path):
         else:
             param_name = f'custom_variables/{key}'
 
-        tree.find(param_name).text = str(value)
+        elements[param] = tree.find(param_name)
 
-    tree.write(config_path)
+    if cell_keys:
+        cell_elements = get_cell_elements(cell_keys, tree, 'cancer')
+        elements.update({f'cell/{key}': element for key, element in cell_elements.items()})
+
+    return elements
+
+
+def get_cell_elements(cell_keys, tree, definition_name='cancer'):
+    """Returns the phenotype elements of a cell definition in a single pass over its groups.
+
+    The phenotype node is found once and each group in CELL_DEFINITIONS_DICT is walked
+    once, instead of running one full XPath search from the root for each parameter.
+    """
+    phenotype = tree.find(f'cell_definitions/cell_definition[@name="{definition_name}"]/phenotype')
+    pending = set(cell_keys)
+    elements = {}
+    for group, params in CELL_DEFINITIONS_DICT.items():
+        keys = pending & set(params)
+        if not keys:
+            continue
+        for element in phenotype.find(group):
+            # Only the first matching element is used, as with tree.find()
+            if element.tag in keys:
+                elements[element.tag] = element
+                keys.discard(element.tag)
+                pending.discard(element.tag)
+
+    if pending:
+        raise KeyError(f'Could not find the cell parameters: {", ".join(pending)}')
+
+    return elements
 
 
 def get_cell_data(timestep, folder_name, variables='all'):
-    """Returns a dictionary with the cell output data for the selected variables.
+    """Returns a DataFrame with the cell output data for the selected variables.
 
     Parameters
     ----------
@@ -75,36 +152,25 @@ def get_cell_data(timestep, folder_name, variables='all'):
         are not defined, all the available outputs will be saved.
     """
 
-    # All possible output variables written by PhysiCell
-    data_labels = [
-        'ID',
-        'position_x', 'position_y', 'position_z',
-        'total_volume',
-        'cell_type',
-        'cycle_model', 'current_phase', 'elapsed_time_in_phase',
-        'nuclear_volume', 'cytoplasmic_volume',
-        'fluid_fraction', 'calcified_fraction',
-        'orientation_x', 'orientation_y', 'orientation_z',
-        'polarity',
-        'migration_speed',
-        'motility_vector_x', 'motility_vector_y', 'motility_vector_z',
-        'migration_bias',
-        'motility_bias_direction_x', 'motility_bias_direction_y', 'motility_bias_direction_z',
-        'persistence_time',
-        'motility_reserved'
-    ]
-
     # Create path name
-    time_str = str(timestep).zfill(8)
-    file_name = 'output{}_cells_physicell.mat'.format(time_str)
+    file_name = f'output{timestep:08d}_cells_physicell.mat'
     path_name = folder_name / file_name
 
     # Read output file
-    cell_data = sio.loadmat(path_name)['cells']
+    cell_data = sio.loadmat(path_name, variable_names=['cells'])['cells']
+
+    # Save all the variables (one column per labelled row of the loaded array;
+    # extra rows written by some PhysiCell versions have no label and are skipped)
+    if variables == 'all':
+        return pd.DataFrame(cell_data[:len(DATA_LABELS)].T, columns=DATA_LABELS)
+
+    unknown_variables = set(variables) - DATA_LABEL_INDEXES.keys()
+    if unknown_variables:
+        raise ValueError(f'Unknown output variables: {", ".join(sorted(unknown_variables))}')
 
     # Select and save the variables of interest
-    variables_indexes = [data_labels.index(var) for var in variables]
-    cells = {var: cell_data[index, :]
-             for var, index in zip(variables, variables_indexes)}
+    # (a single fancy-index returns them as one new block, which the DataFrame takes over)
+    variables_indexes = [DATA_LABEL_INDEXES[var] for var in variables]
+    cells = pd.DataFrame(cell_data[variables_indexes].T, columns=variables, copy=False)
 
     return cells
\ No newline at end of file
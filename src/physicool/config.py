@@ -62,6 +62,21 @@ class ConfigFileParser:
             )
         ]
 
+    def read_substance_params(self, name: str) -> dt.Substance:
+        """
+        Returns the <microenvironment_setup> data for a given substance from the XML file.
+
+        Parameters
+        ----------
+        name
+            The name of the substance to be read.
+        """
+        return dt.Substance(
+            **pcxml.parse_substance(
+                tree=self.tree, path="microenvironment_setup", name=name
+            )
+        )
+
     def read_cycle_params(self, name: str) -> dt.Cycle:
         """
         Returns the <cycle> data for a given cell definition from the XML file.
@@ -1,5 +1,6 @@
 """A module for model calibration and optimization routines."""
 from dataclasses import dataclass, field
+from itertools import product
 from pathlib import Path
 import platform
 import subprocess
@@ -13,7 +14,7 @@ from physicool.updaters import ParamsUpdater
 from physicool.processing import (
     OutputProcessor,
     ErrorQuantification,
-    compute_mean_squared_error,
+    compute_sum_squared_error,
     NEW_OUTPUTS_VERSION,
 )
 from physicool.plotting import SweeperPlot
@@ -190,7 +191,7 @@ class MultiLevelSweep:
     points_dir: int
     percentage_dir: float
     parameters: List[str]
-    error_estimator: ErrorQuantification = compute_mean_squared_error
+    error_estimator: ErrorQuantification = compute_sum_squared_error
     plotter: SweeperPlot = field(init=False)
     results: np.ndarray = field(init=False)
     current_level: int = field(init=False)
@@ -246,29 +247,26 @@ class MultiLevelSweep:
 
     def get_optimal_idx(self) -> Tuple[int, int]:
         """Returns the indexes for the smallest error in the current level."""
-        best_result = np.argmin(self.results[self.current_level])
-        i = int(np.floor(best_result / self.points_dir))
-        j = int(best_result - self.points_dir * i)
+        level_results = self.results[self.current_level]
+        i, j = np.unravel_index(np.argmin(level_results), level_results.shape)
 
-        return i, j
+        return int(i), int(j)
 
     def compute_objective(self, x: np.ndarray, y: np.ndarray) -> None:
         """
         Runs the black box for each cell of the parameter space defined by x and y.
         Also chooses the best optimal point found in the parameter space.
         """
-        for i, x_value in enumerate(x):
-            for j, y_value in enumerate(y):
-                clean_tmp_files()
-                # Select parameters and run the model
-                results = self.black_box.run(
-                    {self.parameters[0]: x_value, self.parameters[1]: y_value}
-                )
+        x_label, y_label = self.parameters
+        level_results = self.results[self.current_level]
 
-                # Compute error between simulated data and target data
-                self.results[self.current_level][i][j] = self.error_estimator(
-                    results, self.target_data
-                )
+        for (i, x_value), (j, y_value) in product(enumerate(x), enumerate(y)):
+            clean_tmp_files()
+            # Select parameters and run the model
+            results = self.black_box.run({x_label: x_value, y_label: y_value})
+
+            # Compute error between simulated data and target data
+            level_results[i, j] = self.error_estimator(results, self.target_data)
 
         i, j = self.get_optimal_idx()
         self.current_opt_point = (x[i], y[j])
@@ -279,6 +277,8 @@ class MultiLevelSweep:
         x, y = self.get_parameter_space()
         # Add the bounds of the parameter space to the plot
         self.plotter.add_bounds_to_ax(x, y, self.current_level)
+        # Show the bounds before the (blocking) simulations of this level are run
+        self.plotter.draw()
 
         # RUn the model for each cell of the parameter space and save the results
         self.compute_objective(x, y)
@@ -2,7 +2,156 @@
 # Data validation is not performed by this module. To safely write to the XML file, use the
 # ConfigFileParser (from the config module) instead.
 from xml.etree import ElementTree
-from typing import List, Union, Dict
+from typing import Callable, List, Tuple, Union, Dict
+
+
+def _str_to_bool(text: str) -> bool:
+    """Converts a PhysiCell boolean string ("true"/"false") to a bool."""
+    return text == "true"
+
+
+def _raw_text(text: str) -> str:
+    """Returns the element text unchanged (None for empty elements)."""
+    return text
+
+
+def _bool_to_str(value: bool) -> str:
+    """Converts a value to a PhysiCell boolean string ("true"/"false")."""
+    return "true" if value else "false"
+
+
+# Each section schema lists (key, child tag relative to the section node, converter)
+_FieldSchema = List[Tuple[str, str, Callable[[str], Union[float, bool, str]]]]
+
+_DOMAIN_FIELDS: _FieldSchema = [
+    ("x_min", "x_min", float),
+    ("x_max", "x_max", float),
+    ("y_min", "y_min", float),
+    ("y_max", "y_max", float),
+    ("z_min", "z_min", float),
+    ("z_max", "z_max", float),
+    ("dx", "dx", float),
+    ("dy", "dy", float),
+    ("dz", "dz", float),
+    ("use_2d", "use_2D", _str_to_bool),
+]
+
+_OVERALL_FIELDS: _FieldSchema = [
+    ("max_time", "max_time", float),
+    ("dt_diffusion", "dt_diffusion", float),
+    ("dt_mechanics", "dt_mechanics", float),
+    ("dt_phenotype", "dt_phenotype", float),
+]
+
+_VOLUME_FIELDS: _FieldSchema = [
+    ("total", "total", float),
+    ("fluid_fraction", "fluid_fraction", float),
+    ("nuclear", "nuclear", float),
+    ("fluid_change_rate", "fluid_change_rate", float),
+    ("cytoplasmic_biomass_change_rate", "cytoplasmic_biomass_change_rate", float),
+    ("nuclear_biomass_change_rate", "nuclear_biomass_change_rate", float),
+    ("calcified_fraction", "calcified_fraction", float),
+    ("calcification_rate", "calcification_rate", float),
+    ("relative_rupture_volume", "relative_rupture_volume", float),
+]
+
+_MECHANICS_FIELDS: _FieldSchema = [
+    ("cell_cell_adhesion_strength", "cell_cell_adhesion_strength", float),
+    ("cell_cell_repulsion_strength", "cell_cell_repulsion_strength", float),
+    (
+        "relative_maximum_adhesion_distance",
+        "relative_maximum_adhesion_distance",
+        float,
+    ),
+    (
+        "set_relative_equilibrium_distance",
+        "options/set_relative_equilibrium_distance",
+        float,
+    ),
+    (
+        "set_absolute_equilibrium_distance",
+        "options/set_absolute_equilibrium_distance",
+        float,
+    ),
+]
+
+_MOTILITY_FIELDS: _FieldSchema = [
+    ("speed", "speed", float),
+    ("persistence_time", "persistence_time", float),
+    ("migration_bias", "migration_bias", float),
+    ("motility_enabled", "options/enabled", _str_to_bool),
+    ("use_2d", "options/use_2D", _str_to_bool),
+    ("chemotaxis_enabled", "options/chemotaxis/enabled", _str_to_bool),
+    ("chemotaxis_substrate", "options/chemotaxis/substrate", _raw_text),
+    ("chemotaxis_direction", "options/chemotaxis/direction", float),
+]
+
+_SUBSTANCE_FIELDS: _FieldSchema = [
+    ("diffusion_coefficient", "physical_parameter_set/diffusion_coefficient", float),
+    ("decay_rate", "physical_parameter_set/decay_rate", float),
+    ("initial_condition", "initial_condition", float),
+    ("dirichlet_boundary_condition", "Dirichlet_boundary_condition", float),
+]
+
+_SECRETION_FIELDS: _FieldSchema = [
+    ("secretion_rate", "secretion_rate", float),
+    ("secretion_target", "secretion_target", float),
+    ("uptake_rate", "uptake_rate", float),
+    ("net_export_rate", "net_export_rate", float),
+]
+
+_DEATH_PARAMETER_FIELDS: _FieldSchema = [
+    ("unlysed_fluid_change_rate", "unlysed_fluid_change_rate", float),
+    ("lysed_fluid_change_rate", "lysed_fluid_change_rate", float),
+    ("cytoplasmic_biomass_change_rate", "cytoplasmic_biomass_change_rate", float),
+    ("nuclear_biomass_change_rate", "nuclear_biomass_change_rate", float),
+    ("calcification_rate", "calcification_rate", float),
+    ("relative_rupture_volume", "relative_rupture_volume", float),
+]
+
+
+def _find_node(tree: ElementTree, path: str, tag: str) -> ElementTree.Element:
+    """
+    Returns the node at the passed path, making sure that it exists and has the expected tag.
+
+    Raises
+    ------
+    ValueError
+        When the passed path does not point to a node with the expected tag.
+    """
+    node = tree.find(path)
+    if node is None or node.tag != tag:
+        raise ValueError("The passed path does not point to the correct node.")
+
+    return node
+
+
+_CUSTOM_TAGS = frozenset({"custom_data", "user_parameters"})
+
+
+def _has_value(element: ElementTree.Element) -> bool:
+    """Checks if an element holds a value (skips empty and whitespace-only nodes)."""
+    return element.text is not None and element.text.strip() != ""
+
+
+def _parse_fields(
+    node: ElementTree.Element, schema: _FieldSchema
+) -> Dict[str, Union[float, bool, str]]:
+    """Reads the fields described by the schema from an already resolved node."""
+    return {key: convert(node.find(tag).text) for key, tag, convert in schema}
+
+
+def _write_fields(
+    node: ElementTree.Element,
+    schema: _FieldSchema,
+    new_values: Dict[str, Union[float, bool, str]],
+) -> None:
+    """Writes the schema fields from new_values to an already resolved node."""
+    for key, tag, convert in schema:
+        value = new_values[key]
+        node.find(tag).text = (
+            _bool_to_str(value) if convert is _str_to_bool else str(value)
+        )
 
 
 def parse_domain(tree: ElementTree, path: str) -> Dict[str, Union[bool, float]]:
@@ -27,32 +176,9 @@ def parse_domain(tree: ElementTree, path: str) -> Dict[str, Union[bool, float]]:
     ValueError
         When the passed path does not point to the domain node.
     """
-    if tree.find(path).tag != "domain":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "domain")
 
-    x_min = float(tree.find(path + "/x_min").text)
-    x_max = float(tree.find(path + "/x_max").text)
-    y_min = float(tree.find(path + "/y_min").text)
-    y_max = float(tree.find(path + "/y_max").text)
-    z_min = float(tree.find(path + "/z_min").text)
-    z_max = float(tree.find(path + "/z_max").text)
-    dx = float(tree.find(path + "/dx").text)
-    dy = float(tree.find(path + "/dy").text)
-    dz = float(tree.find(path + "/dz").text)
-    use_2d = tree.find(path + "/use_2D").text == "true"
-
-    return {
-        "x_min": x_min,
-        "x_max": x_max,
-        "y_min": y_min,
-        "y_max": y_max,
-        "z_min": z_min,
-        "z_max": z_max,
-        "dx": dx,
-        "dy": dy,
-        "dz": dz,
-        "use_2d": use_2d,
-    }
+    return _parse_fields(node, _DOMAIN_FIELDS)
 
 
 def parse_overall(tree: ElementTree, path: str) -> Dict[str, float]:
@@ -77,20 +203,9 @@ def parse_overall(tree: ElementTree, path: str) -> Dict[str, float]:
     ValueError
         When the passed path does not point to the overall node.
     """
-    if tree.find(path).tag != "overall":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "overall")
 
-    max_time = float(tree.find(path + "/max_time").text)
-    dt_diffusion = float(tree.find(path + "/dt_diffusion").text)
-    dt_mechanics = float(tree.find(path + "/dt_mechanics").text)
-    dt_phenotype = float(tree.find(path + "/dt_phenotype").text)
-
-    return {
-        "max_time": max_time,
-        "dt_diffusion": dt_diffusion,
-        "dt_mechanics": dt_mechanics,
-        "dt_phenotype": dt_phenotype,
-    }
+    return _parse_fields(node, _OVERALL_FIELDS)
 
 
 def parse_substance(
@@ -122,35 +237,14 @@ def parse_substance(
     ValueError
         When the passed name does not match any of the variables in the file.
     """
-    if tree.find(path).tag != "microenvironment_setup":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "microenvironment_setup")
 
-    substances = [
-        substance.attrib["name"] for substance in tree.find(path).findall("variable")
-    ]
-
-    if name not in substances:
+    # The variable is looked up by name once and its fields are read relative to it
+    variable = node.find(f"variable[@name='{name}']")
+    if variable is None:
         raise ValueError("The passed substance name is not valid.")
 
-    substance_stem = path + f"/variable[@name='{name}']"
-    diffusion_coefficient = float(
-        tree.find(substance_stem + "/physical_parameter_set/diffusion_coefficient").text
-    )
-    decay_rate = float(
-        tree.find(substance_stem + "/physical_parameter_set/decay_rate").text
-    )
-    initial_condition = float(tree.find(substance_stem + "/initial_condition").text)
-    dirichlet_boundary_condition = float(
-        tree.find(substance_stem + "/Dirichlet_boundary_condition").text
-    )
-
-    return {
-        "name": name,
-        "diffusion_coefficient": diffusion_coefficient,
-        "decay_rate": decay_rate,
-        "initial_condition": initial_condition,
-        "dirichlet_boundary_condition": dirichlet_boundary_condition,
-    }
+    return {"name": name, **_parse_fields(variable, _SUBSTANCE_FIELDS)}
 
 
 def parse_microenvironment(
@@ -179,19 +273,12 @@ def parse_microenvironment(
     ValueError
         When the passed path does not point to the microenvironment node.
     """
-    if tree.find(path).tag != "microenvironment_setup":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "microenvironment_setup")
 
-    substances = [
-        substance.attrib["name"] for substance in tree.find(path).findall("variable")
+    return [
+        {"name": variable.attrib["name"], **_parse_fields(variable, _SUBSTANCE_FIELDS)}
+        for variable in node.findall("variable")
     ]
-    substance_data = []
-
-    for substance in substances:
-        data = parse_substance(tree=tree, path=path, name=substance)
-        substance_data.append(data)
-
-    return substance_data
 
 
 def parse_cycle(tree: ElementTree, path: str) -> Dict[str, Union[float, List[float]]]:
@@ -217,10 +304,7 @@ def parse_cycle(tree: ElementTree, path: str) -> Dict[str, Union[float, List[flo
     ValueError
         When the passed path does not point to a valid cycle node.
     """
-    if tree.find(path).tag != "cycle":
-        raise ValueError("The passed path does not point to the correct node.")
-
-    cycle_node = tree.find(path)
+    cycle_node = _find_node(tree, path, "cycle")
     code = float(cycle_node.attrib["code"])
     data_type = list(cycle_node)[0].tag
     durations = None
@@ -264,57 +348,36 @@ def parse_death_model(
     ValueError
         When the passed name does not match any of the death models for the cell definition.
     """
-    if tree.find(path).tag != "death":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "death")
 
-    models = [model.attrib["name"] for model in tree.find(path).findall("model")]
-    if name not in models:
+    # The model is looked up by name once and its fields are read relative to it
+    model = node.find(f"model[@name='{name}']")
+    if model is None:
         raise ValueError("The passed name does not match a valid death model.")
 
-    model_stem = path + f"/model[@name='{name}']"
-    death_node = tree.find(model_stem)
-    code = float(death_node.attrib["code"])
-    data_type = list(death_node)[1].tag
+    return _parse_death_model_elem(model)
+
+
+def _parse_death_model_elem(
+    model: ElementTree.Element,
+) -> Dict[str, Union[float, List[float]]]:
+    """Reads the data for a death model from its already resolved <model> node."""
+    data_type = model[1].tag
     durations = None
     rates = None
 
-    death_rate = float(tree.find(model_stem + "/death_rate").text)
-
     if data_type == "phase_durations":
-        durations = [float(duration.text) for duration in death_node[1]]
+        durations = [float(duration.text) for duration in model[1]]
     elif data_type == "phase_transition_rates":
-        rates = [float(duration.text) for duration in death_node[1]]
-
-    model_stem += "/parameters"
-    unlysed_fluid_change_rate = float(
-        tree.find(model_stem + "/unlysed_fluid_change_rate").text
-    )
-    lysed_fluid_change_rate = float(
-        tree.find(model_stem + "/lysed_fluid_change_rate").text
-    )
-    cytoplasmic_biomass_change_rate = float(
-        tree.find(model_stem + "/cytoplasmic_biomass_change_rate").text
-    )
-    nuclear_biomass_change_rate = float(
-        tree.find(model_stem + "/nuclear_biomass_change_rate").text
-    )
-    calcification_rate = float(tree.find(model_stem + "/calcification_rate").text)
-    relative_rupture_volume = float(
-        tree.find(model_stem + "/relative_rupture_volume").text
-    )
+        rates = [float(duration.text) for duration in model[1]]
 
     return {
-        "name": name,
-        "code": code,
-        "death_rate": death_rate,
+        "name": model.attrib["name"],
+        "code": float(model.attrib["code"]),
+        "death_rate": float(model.find("death_rate").text),
         "phase_durations": durations,
         "phase_transition_rates": rates,
-        "unlysed_fluid_change_rate": unlysed_fluid_change_rate,
-        "lysed_fluid_change_rate": lysed_fluid_change_rate,
-        "cytoplasmic_biomass_change_rate": cytoplasmic_biomass_change_rate,
-        "nuclear_biomass_change_rate": nuclear_biomass_change_rate,
-        "calcification_rate": calcification_rate,
-        "relative_rupture_volume": relative_rupture_volume,
+        **_parse_fields(model.find("parameters"), _DEATH_PARAMETER_FIELDS),
     }
 
 
@@ -345,17 +408,9 @@ def parse_death(
     ValueError
         When the passed path does not point to the death node.
     """
-    if tree.find(path).tag != "death":
-        raise ValueError("The passed path does not point to the correct node.")
-
-    models = [model.attrib["name"] for model in tree.find(path).findall("model")]
-    death_data = []
+    node = _find_node(tree, path, "death")
 
-    for model in models:
-        data = parse_death_model(tree=tree, path=path, name=model)
-        death_data.append(data)
-
-    return death_data
+    return [_parse_death_model_elem(model) for model in node.findall("model")]
 
 
 def parse_volume(tree: ElementTree, path: str) -> Dict[str, float]:
@@ -383,34 +438,9 @@ def parse_volume(tree: ElementTree, path: str) -> Dict[str, float]:
     ValueError
         When the passed path does not point to a valid volume node.
     """
-    if tree.find(path).tag != "volume":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "volume")
 
-    total = float(tree.find(path + "/total").text)
-    fluid_fraction = float(tree.find(path + "/fluid_fraction").text)
-    nuclear = float(tree.find(path + "/nuclear").text)
-    fluid_change_rate = float(tree.find(path + "/fluid_change_rate").text)
-    cytoplasmic_biomass_change_rate = float(
-        tree.find(path + "/cytoplasmic_biomass_change_rate").text
-    )
-    nuclear_biomass_change_rate = float(
-        tree.find(path + "/nuclear_biomass_change_rate").text
-    )
-    calcified_fraction = float(tree.find(path + "/calcified_fraction").text)
-    calcification_rate = float(tree.find(path + "/calcification_rate").text)
-    relative_rupture_volume = float(tree.find(path + "/relative_rupture_volume").text)
-
-    return {
-        "total": total,
-        "fluid_fraction": fluid_fraction,
-        "nuclear": nuclear,
-        "fluid_change_rate": fluid_change_rate,
-        "cytoplasmic_biomass_change_rate": cytoplasmic_biomass_change_rate,
-        "nuclear_biomass_change_rate": nuclear_biomass_change_rate,
-        "calcified_fraction": calcified_fraction,
-        "calcification_rate": calcification_rate,
-        "relative_rupture_volume": relative_rupture_volume,
-    }
+    return _parse_fields(node, _VOLUME_FIELDS)
 
 
 def parse_mechanics(tree: ElementTree, path: str) -> Dict[str, float]:
@@ -438,34 +468,9 @@ def parse_mechanics(tree: ElementTree, path: str) -> Dict[str, float]:
     ValueError
         When the passed path does not point to a valid mechanics node.
     """
-    if tree.find(path).tag != "mechanics":
-        raise ValueError("The passed path does not point to the correct node.")
-
-    cell_cell_adhesion_strength = float(
-        tree.find(path + "/cell_cell_adhesion_strength").text
-    )
-    cell_cell_repulsion_strength = float(
-        tree.find(path + "/cell_cell_repulsion_strength").text
-    )
-    relative_maximum_adhesion_distance = float(
-        tree.find(path + "/relative_maximum_adhesion_distance").text
-    )
+    node = _find_node(tree, path, "mechanics")
 
-    relative_equilibrium_distance = float(
-        tree.find(path + "/options/set_relative_equilibrium_distance").text
-    )
-
-    absolute_equilibrium_distance = float(
-        tree.find(path + "/options/set_absolute_equilibrium_distance").text
-    )
-
-    return {
-        "cell_cell_adhesion_strength": cell_cell_adhesion_strength,
-        "cell_cell_repulsion_strength": cell_cell_repulsion_strength,
-        "relative_maximum_adhesion_distance": relative_maximum_adhesion_distance,
-        "set_relative_equilibrium_distance": relative_equilibrium_distance,
-        "set_absolute_equilibrium_distance": absolute_equilibrium_distance,
-    }
+    return _parse_fields(node, _MECHANICS_FIELDS)
 
 
 def parse_motility(tree: ElementTree, path: str) -> Dict[str, Union[float, str, bool]]:
@@ -491,28 +496,9 @@ def parse_motility(tree: ElementTree, path: str) -> Dict[str, Union[float, str,
     ValueError
         When the passed path does not point to a valid motility node.
     """
-    if tree.find(path).tag != "motility":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "motility")
 
-    speed = float(tree.find(path + "/speed").text)
-    persistence_time = float(tree.find(path + "/persistence_time").text)
-    migration_bias = float(tree.find(path + "/migration_bias").text)
-    motility_enabled = tree.find(path + "/options/enabled").text == "true"
-    use_2d = tree.find(path + "/options/use_2D").text == "true"
-    chemotaxis_enabled = tree.find(path + "/options/chemotaxis/enabled").text == "true"
-    chemotaxis_substrate = tree.find(path + "/options/chemotaxis/substrate").text
-    chemotaxis_direction = float(tree.find(path + "/options/chemotaxis/direction").text)
-
-    return {
-        "speed": speed,
-        "persistence_time": persistence_time,
-        "migration_bias": migration_bias,
-        "motility_enabled": motility_enabled,
-        "use_2d": use_2d,
-        "chemotaxis_enabled": chemotaxis_enabled,
-        "chemotaxis_substrate": chemotaxis_substrate,
-        "chemotaxis_direction": chemotaxis_direction,
-    }
+    return _parse_fields(node, _MOTILITY_FIELDS)
 
 
 def parse_secretion_substance(
@@ -543,29 +529,14 @@ def parse_secretion_substance(
     ValueError
         When the passed name does not match any of the substances in the secretion data.
     """
-    if tree.find(path).tag != "secretion":
-        raise ValueError("The passed path does not point to the correct node.")
-
-    substrates = [
-        substrate.attrib["name"] for substrate in tree.find(path).findall("substrate")
-    ]
-
-    if name not in substrates:
-        raise ValueError("The passed name does not match a valid death model.")
+    node = _find_node(tree, path, "secretion")
 
-    substrate_stem = path + f"/substrate[@name='{name}']"
-    secretion_rate = float(tree.find(substrate_stem + "/secretion_rate").text)
-    secretion_target = float(tree.find(substrate_stem + "/secretion_target").text)
-    uptake_rate = float(tree.find(substrate_stem + "/uptake_rate").text)
-    net_export_rate = float(tree.find(substrate_stem + "/net_export_rate").text)
+    # The substrate is looked up by name once and its fields are read relative to it
+    substrate = node.find(f"substrate[@name='{name}']")
+    if substrate is None:
+        raise ValueError("The passed substance name is not valid.")
 
-    return {
-        "name": name,
-        "secretion_rate": secretion_rate,
-        "secretion_target": secretion_target,
-        "uptake_rate": uptake_rate,
-        "net_export_rate": net_export_rate,
-    }
+    return {"name": name, **_parse_fields(substrate, _SECRETION_FIELDS)}
 
 
 def parse_secretion(tree: ElementTree, path: str) -> List[Dict[str, Union[str, float]]]:
@@ -591,19 +562,15 @@ def parse_secretion(tree: ElementTree, path: str) -> List[Dict[str, Union[str, f
     ValueError
         When the passed path does not point to the secretion node.
     """
-    if tree.find(path).tag != "secretion":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "secretion")
 
-    substrates = [
-        substrate.attrib["name"] for substrate in tree.find(path).findall("substrate")
+    return [
+        {
+            "name": substrate.attrib["name"],
+            **_parse_fields(substrate, _SECRETION_FIELDS),
+        }
+        for substrate in node.findall("substrate")
     ]
-    secretion_data = []
-
-    for substrate in substrates:
-        data = parse_secretion_substance(tree=tree, path=path, name=substrate)
-        secretion_data.append(data)
-
-    return secretion_data
 
 
 def parse_custom(tree: ElementTree, path: str) -> List[Dict[str, Union[float, str]]]:
@@ -629,15 +596,14 @@ def parse_custom(tree: ElementTree, path: str) -> List[Dict[str, Union[float, st
     ValueError
         When the passed path does not point to a valid custom node.
     """
-    if (tree.find(path).tag != "custom_data") & (
-        tree.find(path).tag != "user_parameters"
-    ):
+    node = tree.find(path)
+    if node is None or node.tag not in _CUSTOM_TAGS:
         raise ValueError("The passed path does not point to the correct node.")
 
     return [
         {"name": variable.tag, "value": float(variable.text)}
-        for variable in list(tree.find(path))
-        if variable.text
+        for variable in node
+        if _has_value(variable)
     ]
 
 
@@ -663,23 +629,10 @@ def write_domain(
     ValueError
         When the passed path does not point to the valid domain node.
     """
-    if tree.find(path).tag != "domain":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "domain")
 
     try:
-        tree.find(path + "/x_min").text = str(new_values["x_min"])
-        tree.find(path + "/x_max").text = str(new_values["x_max"])
-        tree.find(path + "/y_min").text = str(new_values["y_min"])
-        tree.find(path + "/y_max").text = str(new_values["y_max"])
-        tree.find(path + "/z_min").text = str(new_values["z_min"])
-        tree.find(path + "/z_max").text = str(new_values["z_max"])
-        tree.find(path + "/dx").text = str(new_values["dx"])
-        tree.find(path + "/dy").text = str(new_values["dy"])
-        tree.find(path + "/dz").text = str(new_values["dz"])
-        if new_values["use_2d"]:
-            tree.find(path + "/use_2D").text = "true"
-        else:
-            tree.find(path + "/use_2D").text = "false"
+        _write_fields(node, _DOMAIN_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -705,14 +658,10 @@ def write_overall(new_values: Dict[str, float], tree: ElementTree, path: str) ->
     ValueError
         When the passed path does not point to the valid overall node.
     """
-    if tree.find(path).tag != "overall":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "overall")
 
     try:
-        tree.find(path + "/max_time").text = str(new_values["max_time"])
-        tree.find(path + "/dt_diffusion").text = str(new_values["dt_diffusion"])
-        tree.find(path + "/dt_mechanics").text = str(new_values["dt_mechanics"])
-        tree.find(path + "/dt_phenotype").text = str(new_values["dt_phenotype"])
+        _write_fields(node, _OVERALL_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -742,30 +691,14 @@ def write_substance(new_values, tree: ElementTree, path: str, name: str) -> None
     ValueError
         When the passed name does not match any of the substances in the file.
     """
-    if tree.find(path).tag != "microenvironment_setup":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "microenvironment_setup")
 
-    substances = [
-        substance.attrib["name"] for substance in tree.find(path).findall("variable")
-    ]
-
-    if name not in substances:
+    variable = node.find(f"variable[@name='{name}']")
+    if variable is None:
         raise ValueError("The passed substance name is not valid.")
 
     try:
-        substance_stem = path + f"/variable[@name='{name}']"
-        tree.find(
-            substance_stem + "/physical_parameter_set/diffusion_coefficient"
-        ).text = str(new_values["diffusion_coefficient"])
-        tree.find(substance_stem + "/physical_parameter_set/decay_rate").text = str(
-            new_values["decay_rate"]
-        )
-        tree.find(substance_stem + "/initial_condition").text = str(
-            new_values["initial_condition"]
-        )
-        tree.find(substance_stem + "/Dirichlet_boundary_condition").text = str(
-            new_values["dirichlet_boundary_condition"]
-        )
+        _write_fields(variable, _SUBSTANCE_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -798,12 +731,11 @@ def write_cycle(
         When the number of transition rates/durations does not match the values
         in the XML file.
     """
-    if tree.find(path).tag != "cycle":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "cycle")
 
     try:
-        if tree.find(path + "/phase_durations"):
-            durations = list(tree.find(path + "/phase_durations"))
+        durations = node.find("phase_durations")
+        if durations is not None:
             new_durations = new_values["phase_durations"]
 
             if len(durations) != len(new_durations):
@@ -814,7 +746,7 @@ def write_cycle(
             for new_value, element in zip(new_durations, durations):
                 element.text = str(new_value)
         else:
-            rates = list(tree.find(path + "/phase_transition_rates"))
+            rates = node.find("phase_transition_rates")
             new_rates = new_values["phase_transition_rates"]
 
             if len(rates) != len(new_rates):
@@ -858,20 +790,19 @@ def write_death_model(
         When the number of transition rates/durations does not match the values
         in the XML file.
     """
-    if tree.find(path).tag != "death":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "death")
 
     name = new_values["name"]
-    models = [model.attrib["name"] for model in tree.find(path).findall("model")]
+    models = [model.attrib["name"] for model in node.findall("model")]
     if name not in models:
         raise ValueError("The passed name does not match a valid death model.")
 
     try:
-        model_stem = path + f"/model[@name='{name}']"
-        tree.find(model_stem + "/death_rate").text = str(new_values["death_rate"])
+        model = node.find(f"model[@name='{name}']")
+        model.find("death_rate").text = str(new_values["death_rate"])
 
-        if tree.find(model_stem + "/phase_durations"):
-            durations = list(tree.find(model_stem + "/phase_durations"))
+        durations = model.find("phase_durations")
+        if durations is not None:
             new_durations = new_values["phase_durations"]
 
             if len(durations) != len(new_durations):
@@ -883,7 +814,7 @@ def write_death_model(
                 element.text = str(new_value)
 
         else:
-            rates = list(tree.find(model_stem + "/phase_transition_rates"))
+            rates = model.find("phase_transition_rates")
             new_rates = new_values["phase_transition_rates"]
 
             if len(rates) != len(new_rates):
@@ -894,24 +825,7 @@ def write_death_model(
             for new_value, element in zip(new_rates, rates):
                 element.text = str(new_value)
 
-        tree.find(model_stem + "/parameters/unlysed_fluid_change_rate").text = str(
-            new_values["unlysed_fluid_change_rate"]
-        )
-        tree.find(model_stem + "/parameters/lysed_fluid_change_rate").text = str(
-            new_values["lysed_fluid_change_rate"]
-        )
-        tree.find(
-            model_stem + "/parameters/cytoplasmic_biomass_change_rate"
-        ).text = str(new_values["cytoplasmic_biomass_change_rate"])
-        tree.find(model_stem + "/parameters/nuclear_biomass_change_rate").text = str(
-            new_values["nuclear_biomass_change_rate"]
-        )
-        tree.find(model_stem + "/parameters/calcification_rate").text = str(
-            new_values["calcification_rate"]
-        )
-        tree.find(model_stem + "/parameters/relative_rupture_volume").text = str(
-            new_values["relative_rupture_volume"]
-        )
+        _write_fields(model.find("parameters"), _DEATH_PARAMETER_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -938,31 +852,10 @@ def write_volume(new_values: Dict[str, float], tree: ElementTree, path: str) ->
     ValueError
         When the passed path does not point to the valid volume node.
     """
-    if tree.find(path).tag != "volume":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "volume")
 
     try:
-        tree.find(path + "/total").text = str(new_values["total"])
-        tree.find(path + "/fluid_fraction").text = str(new_values["fluid_fraction"])
-        tree.find(path + "/nuclear").text = str(new_values["nuclear"])
-        tree.find(path + "/fluid_change_rate").text = str(
-            new_values["fluid_change_rate"]
-        )
-        tree.find(path + "/cytoplasmic_biomass_change_rate").text = str(
-            new_values["cytoplasmic_biomass_change_rate"]
-        )
-        tree.find(path + "/nuclear_biomass_change_rate").text = str(
-            new_values["nuclear_biomass_change_rate"]
-        )
-        tree.find(path + "/calcified_fraction").text = str(
-            new_values["calcified_fraction"]
-        )
-        tree.find(path + "/calcification_rate").text = str(
-            new_values["calcification_rate"]
-        )
-        tree.find(path + "/relative_rupture_volume").text = str(
-            new_values["relative_rupture_volume"]
-        )
+        _write_fields(node, _VOLUME_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -989,25 +882,10 @@ def write_mechanics(new_values: Dict[str, float], tree: ElementTree, path: str)
     ValueError
         When the passed path does not point to the valid mechanics node.
     """
-    if tree.find(path).tag != "mechanics":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "mechanics")
 
     try:
-        tree.find(path + "/cell_cell_adhesion_strength").text = str(
-            new_values["cell_cell_adhesion_strength"]
-        )
-        tree.find(path + "/cell_cell_repulsion_strength").text = str(
-            new_values["cell_cell_repulsion_strength"]
-        )
-        tree.find(path + "/relative_maximum_adhesion_distance").text = str(
-            new_values["relative_maximum_adhesion_distance"]
-        )
-        tree.find(path + "/options/set_relative_equilibrium_distance").text = str(
-            new_values["set_relative_equilibrium_distance"]
-        )
-        tree.find(path + "/options/set_absolute_equilibrium_distance").text = str(
-            new_values["set_absolute_equilibrium_distance"]
-        )
+        _write_fields(node, _MECHANICS_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -1036,35 +914,10 @@ def write_motility(
     ValueError
         When the passed path does not point to the valid motility node.
     """
-    if tree.find(path).tag != "motility":
-        raise ValueError("The passed path does not point to the correct node.")
+    node = _find_node(tree, path, "motility")
 
     try:
-        tree.find(path + "/speed").text = str(new_values["speed"])
-        tree.find(path + "/persistence_time").text = str(new_values["persistence_time"])
-        tree.find(path + "/migration_bias").text = str(new_values["migration_bias"])
-
-        if new_values["motility_enabled"]:
-            tree.find(path + "/options/enabled").text = "true"
-        else:
-            tree.find(path + "/options/enabled").text = "false"
-
-        if new_values["use_2d"]:
-            tree.find(path + "/options/use_2D").text = "true"
-        else:
-            tree.find(path + "/options/use_2D").text = "false"
-
-        chemo_str = path + "/options/chemotaxis"
-
-        if new_values["chemotaxis_enabled"]:
-            tree.find(chemo_str + "/enabled").text = "true"
-        else:
-            tree.find(chemo_str + "/enabled").text = "false"
-
-        tree.find(chemo_str + "/substrate").text = new_values["chemotaxis_substrate"]
-        tree.find(chemo_str + "/direction").text = str(
-            new_values["chemotaxis_direction"]
-        )
+        _write_fields(node, _MOTILITY_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -1097,22 +950,14 @@ def write_secretion_substance(
     ValueError
         When the passed name does not match any of the substances in the file.
     """
-    if tree.find(path).tag != "secretion":
-        raise ValueError("The passed path does not point to the correct node.")
-
-    substances = [
-        substance.attrib["name"] for substance in tree.find(path).findall("substrate")
-    ]
+    node = _find_node(tree, path, "secretion")
 
-    if name not in substances:
+    substrate = node.find(f"substrate[@name='{name}']")
+    if substrate is None:
         raise ValueError("The passed substance name is not valid.")
 
     try:
-        stem = path + f"/substrate[@name='{name}']"
-        tree.find(stem + "/secretion_rate").text = str(new_values["secretion_rate"])
-        tree.find(stem + "/secretion_target").text = str(new_values["secretion_target"])
-        tree.find(stem + "/uptake_rate").text = str(new_values["uptake_rate"])
-        tree.find(stem + "/net_export_rate").text = str(new_values["net_export_rate"])
+        _write_fields(substrate, _SECRETION_FIELDS, new_values)
 
     except KeyError:
         print("The passed dictionary does not have all the domain variables.")
@@ -1143,16 +988,15 @@ def write_custom_data(
     ValueError
         When the passed list does not match the variables in the config file.
     """
-    if (tree.find(path).tag != "custom_data") & (
-        tree.find(path).tag != "user_parameters"
-    ):
+    node = tree.find(path)
+    if node is None or node.tag not in _CUSTOM_TAGS:
         raise ValueError("The passed path does not point to the correct node.")
 
-    variables_names = [var.tag for var in list(tree.find(path)) if var.text]
+    variables_names = [var.tag for var in node if _has_value(var)]
     new_variables_names = [var["name"] for var in new_values]
 
     if variables_names != new_variables_names:
         raise ValueError("The custom variables do not match those in the XML file.")
 
     for variable in new_values:
-        tree.find(path + f"/{variable['name']}").text = str(variable["value"])
+        node.find(variable["name"]).text = str(variable["value"])
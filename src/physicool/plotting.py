@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 
 import matplotlib.pyplot as plt
 from matplotlib import colors
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Rectangle
 import mpl_toolkits.mplot3d.art3d as art3d
 import pandas as pd
@@ -31,19 +32,24 @@ class SweeperPlot:
         self.ax.set_xlabel(param_labels[1], labelpad=10)
 
         self.fig.show()
-        self.fig.canvas.draw()
+        self.draw()
 
     def draw(self):
-        """Updates the figure."""
-        self.fig.canvas.draw()
+        """Requests a figure update and processes pending GUI events to render it."""
+        self.fig.canvas.draw_idle()
+        # The sweep blocks the event loop, so pending events are processed here
+        self.fig.canvas.flush_events()
 
     def add_bounds_to_ax(self, x: np.ndarray, y: np.ndarray, z: int) -> None:
         """Draws the bounds for a level's parameter space."""
-        width = max(y) - min(y)
-        height = max(x) - min(x)
+        # The parameter ranges come from np.linspace, so their bounds are the end points
+        x_min, x_max = sorted((x[0], x[-1]))
+        y_min, y_max = sorted((y[0], y[-1]))
+        width = y_max - y_min
+        height = x_max - x_min
 
         p = Rectangle(
-            (min(y), min(x)),
+            (y_min, x_min),
             width,
             height,
             edgecolor="black",
@@ -53,7 +59,6 @@ class SweeperPlot:
 
         self.ax.add_patch(p)
         art3d.pathpatch_2d_to_3d(p, z=z, zdir="y")
-        self.draw()
 
     @staticmethod
     def get_colormap(level_values: np.ndarray) -> np.ndarray:
@@ -85,7 +90,13 @@ class SweeperPlot:
             cstride=1,
         )
 
-        self.fig.canvas.draw()
+        self.draw()
+
+
+def _get_cell_colors(number_of_cells: int) -> List[str]:
+    """Returns one color per cell, following the default Matplotlib color cycle."""
+    cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    return [cycle[i % len(cycle)] for i in range(number_of_cells)]
 
 
 def plot_trajectories_2d(trajectories: pd.DataFrame, ax: Optional[plt.Axes] = None):
@@ -102,12 +113,15 @@ def plot_trajectories_2d(trajectories: pd.DataFrame, ax: Optional[plt.Axes] = No
     if ax is None:
         fig, ax = plt.subplots()
 
-    for cell in trajectories:
-        ax.plot(cell["position_x"].values, cell["position_y"].values)
+    # Draw all the trajectories as a single collection and all the end points at once
+    segments = [cell[["position_x", "position_y"]].values for cell in trajectories]
+    cell_colors = _get_cell_colors(len(segments))
 
-        ax.scatter(
-            cell["position_x"].values[-1], cell["position_y"].values[-1], marker="o"
-        )
+    ax.add_collection(LineCollection(segments, colors=cell_colors))
+    ax.autoscale_view()
+
+    end_points = np.array([segment[-1] for segment in segments]).reshape(-1, 2)
+    ax.scatter(end_points[:, 0], end_points[:, 1], c=cell_colors, marker="o")
 
     return ax
 
@@ -127,18 +141,20 @@ def plot_trajectories_3d(trajectories: pd.DataFrame, ax: Optional[plt.Axes] = No
         fig = plt.figure()
         ax = fig.add_subplot(projection="3d")
 
-    for cell in trajectories:
-        ax.plot(
-            cell["position_x"].values,
-            cell["position_y"].values,
-            cell["position_z"].values,
-        )
-
-        ax.scatter(
-            cell["position_x"].values[-1],
-            cell["position_y"].values[-1],
-            cell["position_z"].values[-1],
-            marker="o",
-        )
+    # Draw all the trajectories as a single collection and all the end points at once
+    segments = [
+        cell[["position_x", "position_y", "position_z"]].values for cell in trajectories
+    ]
+    cell_colors = _get_cell_colors(len(segments))
+
+    if segments:
+        ax.add_collection3d(art3d.Line3DCollection(segments, colors=cell_colors))
+        points = np.concatenate(segments)
+        ax.auto_scale_xyz(points[:, 0], points[:, 1], points[:, 2])
+
+    end_points = np.array([segment[-1] for segment in segments]).reshape(-1, 3)
+    ax.scatter(
+        end_points[:, 0], end_points[:, 1], end_points[:, 2], c=cell_colors, marker="o"
+    )
 
     return ax
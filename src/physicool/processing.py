@@ -1,4 +1,6 @@
 """A module to process output PhysiCell files and extract metrics from the data."""
+import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Union, List, Tuple
 from xml.etree import ElementTree
@@ -37,6 +39,8 @@ CELL_OUTPUT_LABELS = [
     "persistence_time",
     "motility_reserved",
 ]
+# Row of each output variable in the cell data matrix
+_CELL_LABEL_INDEXES = {label: index for index, label in enumerate(CELL_OUTPUT_LABELS)}
 
 
 class Microenvironment:
@@ -44,95 +48,106 @@ class Microenvironment:
         self.storage = path
 
         self.time = time_point
-        self.substances = self.get_substances()
-        self.mesh = self.get_mesh()
+
+        # Open the first XML file once to get the stored substances and the mesh
+        root = ElementTree.parse(self.storage / "output00000000.xml").getroot()
+        self.substances = self.get_substances(root)
+        self.mesh = self.get_mesh(root)
         self.mesh_shape = (len(self.mesh[1]), len(self.mesh[0]))
 
         self.data = self.get_data()
 
-    def get_substances(self):
+    def get_substances(self, root: ElementTree.Element):
         """Returns a list of the substances stored in the XML output files."""
-
-        # Open the first XML file to get list of stored substances
-        tree = ElementTree.parse(self.storage / "output00000000.xml")
-        root = tree.getroot()
         var_node = root.find("microenvironment/domain/variables")
         var_children = var_node.findall("variable")
         variables = [var.get("name") for var in var_children]
 
         return variables
 
-    def get_mesh(self):
+    def get_mesh(self, root: ElementTree.Element):
         """Returns a list with the coordinates of the microenvironment mesh."""
-
-        # Open the first XML file to get list of stored substances
-        tree = ElementTree.parse(self.storage / "output00000000.xml")
-        root = tree.getroot()
         mesh_node = root.find("microenvironment/domain/mesh")
 
         # Get x, y and z coordinates
-        # X coordinates
-        coord_str = mesh_node.find("x_coordinates").text
-        delimiter = mesh_node.find("x_coordinates").get("delimiter")
-        x_coords = np.array(coord_str.split(delimiter), dtype=float)
-        # Y coordinates
-        coord_str = mesh_node.find("y_coordinates").text
-        delimiter = mesh_node.find("y_coordinates").get("delimiter")
-        y_coords = np.array(coord_str.split(delimiter), dtype=float)
-        # Z coordinates
-        coord_str = mesh_node.find("z_coordinates").text
-        delimiter = mesh_node.find("z_coordinates").get("delimiter")
-        z_coords = np.array(coord_str.split(delimiter), dtype=float)
-
-        return [x_coords, y_coords, z_coords]
+        # (parsed directly by NumPy, without splitting the text into a list of strings)
+        coords = []
+        for axis in ("x", "y", "z"):
+            coord_node = mesh_node.find(f"{axis}_coordinates")
+            coords.append(
+                np.fromstring(
+                    coord_node.text, dtype=float, sep=coord_node.get("delimiter")
+                )
+            )
 
-    def get_substance_data(self, substance):
-        """Returns an array with the substance concentrations for all the planes of the domain."""
+        return coords
 
-        timestep = str(self.time).zfill(8)
+    def _load_me_data(self) -> np.ndarray:
+        """Returns the microenvironment matrix (one row per coordinate/substance, one column per voxel)."""
+        me_file = self.storage / f"output{self.time:08d}_microenvironment0.mat"
 
-        me_file = self.storage / "output{}_microenvironment0.mat".format(timestep)
+        # Only the microenvironment matrix is read from the file
+        me_variable = "multiscale_microenvironment"
+        return sio.loadmat(me_file, variable_names=[me_variable])[me_variable]
 
-        # Load substance data
-        me_data = sio.loadmat(me_file)["multiscale_microenvironment"]
+    def _split_planes(self, me_data: np.ndarray, rows: slice) -> np.ndarray:
+        """Returns the selected substance rows as an array with shape (substances, z, y, x)."""
+        # (copied into a single C-contiguous block only if the file was not stored that way)
+        values = np.ascontiguousarray(me_data[rows])
+        z_levels = self.mesh[2]
+        shape = (len(values), len(z_levels), *self.mesh_shape)
 
-        # Select the data corresponding to the chosen substance
-        substance_index = self.substances.index(substance)
-        substance_data = np.array(
-            [
-                np.reshape(
-                    me_data[substance_index + 4, me_data[2, :] == z_level],
-                    self.mesh_shape,
-                )
-                for z_level in self.mesh[2]
-            ]
-        )
+        # PhysiCell stores the voxels plane by plane (z-major order), so the data can
+        # be reshaped directly. Otherwise, each plane is selected by its z coordinate.
+        if np.array_equal(me_data[2, :], np.repeat(z_levels, np.prod(self.mesh_shape))):
+            return values.reshape(shape)
+
+        # The voxels are sorted by z once (stable, to keep their order in each plane)
+        # and each plane is a contiguous range of the sorted voxels
+        order = np.argsort(me_data[2, :], kind="stable")
+        sorted_z = me_data[2, order]
+        starts = np.searchsorted(sorted_z, z_levels, side="left")
+        ends = np.searchsorted(sorted_z, z_levels, side="right")
+        planes = [values[:, order[start:end]] for start, end in zip(starts, ends)]
+
+        return np.stack(planes, axis=1).reshape(shape)
+
+    def get_substance_data(self, substance):
+        """Returns an array with the substance concentrations for all the planes of the domain."""
+        me_data = self._load_me_data()
 
-        return substance_data
+        # Select the data corresponding to the chosen substance
+        row = self.substances.index(substance) + 4
+        return self._split_planes(me_data, slice(row, row + 1))[0]
 
     def get_data(self):
         """Returns a dictionary with the data for all the substances in the simulation."""
+        # The file is read once and all the substances are split into planes together,
+        # so that their data is stored in a single (substances, z, y, x) array
+        me_data = self._load_me_data()
+        all_data = self._split_planes(me_data, slice(4, 4 + len(self.substances)))
 
-        me_data = {
-            substance: self.get_substance_data(substance)
-            for substance in self.substances
-        }
+        return dict(zip(self.substances, all_data))
 
-        return me_data
+
+def _load_cell_matrix(path: str) -> np.ndarray:
+    """Loads the raw cell data (one row per output variable) from an output mat file."""
+    # Only the "cells" matrix is read from the file
+    return sio.loadmat(path, variable_names=["cells"])["cells"]
 
 
 def read_mat_file_cells(path: str, variables: List[str]) -> pd.DataFrame:
     """Loads the data from the output mat files into a Pandas DataFrame."""
     # Make sure that the variables can be found in the file
-    if any([var not in CELL_OUTPUT_LABELS for var in variables]):
+    if any(var not in _CELL_LABEL_INDEXES for var in variables):
         raise ValueError("The passed variables are not valid names.")
 
-    cell_data = sio.loadmat(path)["cells"]
+    cell_data = _load_cell_matrix(path)
     # Select and save the variables of interest
-    variables_indexes = [CELL_OUTPUT_LABELS.index(var) for var in variables]
-    cells = pd.DataFrame.from_dict(
-        {var: cell_data[index, :] for var, index in zip(variables, variables_indexes)}
-    )
+    # (a single fancy-index returns them as one new contiguous block, one row per variable,
+    # which the DataFrame can take over without copying it again)
+    variables_indexes = [_CELL_LABEL_INDEXES[var] for var in variables]
+    cells = pd.DataFrame(cell_data[variables_indexes].T, columns=variables, copy=False)
 
     return cells
 
@@ -148,6 +163,8 @@ def convert_version_str_to_tuple(version: str) -> Tuple[int]:
     return tuple([int(x) for x in version.split(".")])
 
 
+# Called for every output file that is read, with only a handful of distinct versions
+@lru_cache(maxsize=None)
 def check_version_status(version: str) -> bool:
     """Compares the passed version to the first version with the output*_cells.mat format."""
     return convert_version_str_to_tuple(version) >= convert_version_str_to_tuple(
@@ -162,13 +179,22 @@ def get_cell_file_name(version: str) -> str:
     return "output{}_cells_physicell.mat"
 
 
-def get_cell_file_num(output_path: Path, version: str) -> str:
-    pattern = (
-        "output*_cells.mat"
-        if check_version_status(version)
-        else "output*_cells_physicell.mat"
-    )
-    return len([file for file in output_path.glob(pattern)])
+def get_cell_file_num(output_path: Path, version: str) -> int:
+    """Returns the number of cell output files in the output folder."""
+    pattern = get_cell_file_name(version=version).format("*")
+    return sum(1 for _ in output_path.glob(pattern))
+
+
+def _get_cell_file_path(timestep: int, output_path: Path, version: str) -> str:
+    """Returns the absolute path (as a string, for loadmat) to a time point's cell file."""
+    file_name = get_cell_file_name(version=version).format(f"{timestep:08d}")
+    path_name = output_path / file_name
+
+    # Make sure that the timestep has been recorded and saved
+    if not path_name.is_file():
+        raise ValueError("The passed time point does not match any file.")
+
+    return path_name.absolute().as_posix()
 
 
 def get_cell_data(
@@ -198,20 +224,10 @@ def get_cell_data(
     if isinstance(output_path, str):
         output_path = Path(output_path)
 
-    time_str = str(timestep).zfill(8)
-    file_stem = get_cell_file_name(version=version)
-    file_name = file_stem.format(time_str)
-    path_name = output_path / file_name
-
-    # Make sure that the timestep has been recorded and saved
-    if path_name not in output_path.glob(file_stem.format("*")):
-        raise ValueError("The passed time point does not match any file.")
+    path_name = _get_cell_file_path(timestep, output_path, version)
 
     # Read output file into a DataFrame
-    # (changing Path to a string with its absolute path. loadmat takes strings as input)
-    cells = read_mat_file_cells(
-        path=path_name.absolute().as_posix(), variables=variables
-    )
+    cells = read_mat_file_cells(path=path_name, variables=variables)
 
     cells["timestep"] = timestep
 
@@ -239,9 +255,8 @@ def get_cells_in_z_slice(data: pd.DataFrame, size: float) -> pd.DataFrame:
     if "position_z" not in data.columns:
         raise ValueError("The DataFrame doesn't include the cells' z coordinates.")
 
-    return data[
-        (data["position_z"] >= -size / 2) & (data["position_z"] <= size / 2)
-    ].copy()
+    half_size = size / 2
+    return data[data["position_z"].between(-half_size, half_size)].copy()
 
 
 def get_cell_trajectories(
@@ -265,20 +280,22 @@ def get_cell_trajectories(
         output_path = Path(output_path)
 
     variables = ["ID", "position_x", "position_y", "position_z"]
-    data = []
     number_of_timepoints = get_cell_file_num(output_path=output_path, version=version)
 
-    for i in range(number_of_timepoints):
-        cells = get_cell_data(
+    # get_cell_data already adds the timestep column to each DataFrame
+    data = [
+        get_cell_data(
             timestep=i, variables=variables, output_path=output_path, version=version
         )
-        cells["timestep"] = i
-        data.append(cells)
+        for i in range(number_of_timepoints)
+    ]
 
+    # Each row keeps its index from its output file (the cell's row in that file)
     new_data = pd.concat(data)
+    # Group the rows by cell ID once (in order of appearance) instead of filtering per cell
     trajectories = [
-        new_data[new_data["ID"] == cell_id][["position_x", "position_y", "position_z"]]
-        for cell_id in new_data["ID"].unique()
+        cell_data[["position_x", "position_y", "position_z"]]
+        for _, cell_data in new_data.groupby("ID", sort=False)
     ]
 
     return trajectories
@@ -309,11 +326,10 @@ def get_cell_numbers_over_time(
     number_of_timepoints = get_cell_file_num(output_path=output_path, version=version)
     number_of_cells = np.empty(shape=(number_of_timepoints,))
 
+    # Count the cells from the raw matrix (one column per cell), without a DataFrame
     for i in range(number_of_timepoints):
-        cells = get_cell_data(
-            timestep=i, variables=["ID"], output_path=output_path, version=version
-        )
-        number_of_cells[i] = cells["ID"].size
+        path_name = _get_cell_file_path(i, output_path, version)
+        number_of_cells[i] = _load_cell_matrix(path_name).shape[1]
 
     return number_of_cells
 
@@ -322,7 +338,7 @@ def get_final_y_position(
     output_path: Path = Path("output"), version: str = NEW_OUTPUTS_VERSION
 ) -> np.ndarray:
     """
-    Returns the number of cells over time (one value for each simulation time point).
+    Returns the y coordinates of the cells at the last simulation time point.
 
     Parameters
     ----------
@@ -332,27 +348,54 @@ def get_final_y_position(
     Returns
     -------
     np.ndarray
-        An array with the number of cells at every simulation time point.
+        An array with the y coordinate of every cell at the last time point.
     """
     if isinstance(output_path, str):
         output_path = Path(output_path)
 
     last_point = get_cell_file_num(output_path=output_path, version=version)
-    cells = get_cell_data(
-        timestep=last_point - 1,
-        variables=["position_y"],
-        output_path=output_path,
-        version=version,
-    )
+    path_name = _get_cell_file_path(last_point - 1, output_path, version)
 
-    return cells["position_y"].values
+    # Copy the row of the raw matrix, without building a DataFrame
+    # (so the returned array does not keep the whole matrix alive)
+    cell_data = _load_cell_matrix(path_name)
+    return cell_data[_CELL_LABEL_INDEXES["position_y"]].copy()
 
 
 ErrorQuantification = Callable[[np.ndarray, np.ndarray], float]
 
 
+def compute_sum_squared_error(
+    model_data: np.ndarray, reference_data: np.ndarray
+) -> float:
+    """
+    Returns the sum of the squared errors between the reference and simulated datasets.
+    The squared differences are summed (not averaged), so the value scales with the
+    number of data points; the sweeps only compare it between parameter sets.
+
+    Both inputs are converted to NumPy arrays before being compared, so Pandas
+    objects are aligned by position and not by their index labels.
+    """
+    # Only the differences are stored; squaring and summing happen in a single dot product
+    differences = np.ravel(
+        np.subtract(
+            np.asarray(model_data, dtype=float), np.asarray(reference_data, dtype=float)
+        )
+    )
+    return np.dot(differences, differences)
+
+
 def compute_mean_squared_error(
     model_data: np.ndarray, reference_data: np.ndarray
 ) -> float:
-    """Returns the mean squared error value between the reference and simulated datasets."""
-    return ((model_data - reference_data) ** 2).sum()
+    """
+    Deprecated alias of `compute_sum_squared_error`, kept for backwards compatibility.
+    Despite its name, it returns the sum (not the mean) of the squared errors.
+    """
+    warnings.warn(
+        "compute_mean_squared_error is deprecated and returns the sum of the squared "
+        "errors; use compute_sum_squared_error instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return compute_sum_squared_error(model_data, reference_data)
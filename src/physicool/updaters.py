@@ -1,14 +1,56 @@
 """A module to create model updater functions for the PhysiCOOL black-box."""
 from abc import ABC, abstractclassmethod
 from pathlib import Path
-from typing import Dict, Union, Callable
+from typing import Dict, FrozenSet, Union, Callable
 from dataclasses import dataclass, field
 
+from pydantic import BaseModel
+
 import physicool.datatypes as dt
 from physicool.config import ConfigFileParser
 
 CellUpdaterFunction = Callable[[dt.CellParameters, Dict[str, float]], None]
 
+# The fields that each updater function is allowed to modify
+_VOLUME_KEYS = frozenset(
+    {
+        "total",
+        "fluid_fraction",
+        "nuclear",
+        "fluid_change_rate",
+        "cytoplasmic_biomass_change_rate",
+        "nuclear_biomass_change_rate",
+        "calcified_fraction",
+        "calcification_rate",
+        "relative_rupture_volume",
+    }
+)
+_MOTILITY_KEYS = frozenset({"speed", "persistence_time", "migration_bias"})
+_MECHANICS_KEYS = frozenset(
+    {
+        "cell_cell_adhesion_strength",
+        "cell_cell_repulsion_strength",
+        "relative_maximum_adhesion_distance",
+    }
+)
+_SUBSTANCE_KEYS = frozenset(
+    {
+        "diffusion_coefficient",
+        "decay_rate",
+        "initial_condition",
+        "dirichlet_boundary_condition",
+    }
+)
+
+
+def _update_fields(
+    target: BaseModel, new_values: Dict[str, float], allowed_keys: FrozenSet[str]
+) -> None:
+    """Sets the passed values on the target model, skipping keys that are not allowed."""
+    for key, value in new_values.items():
+        if key in allowed_keys:
+            setattr(target, key, value)
+
 
 def update_cycle_values(cell_data: dt.CellParameters, new_values: Dict[str, float]):
     """
@@ -58,28 +100,7 @@ def update_volume_values(cell_data: dt.CellParameters, new_values: Dict[str, flo
         of the CellParameters class. Keys should be the same as those in the XML file,
         but it is not required to include all the keys.
     """
-    if "total" in new_values.keys():
-        cell_data.volume.total = new_values["total"]
-    if "fluid_fraction" in new_values.keys():
-        cell_data.volume.fluid_fraction = new_values["fluid_fraction"]
-    if "nuclear" in new_values.keys():
-        cell_data.volume.nuclear = new_values["nuclear"]
-    if "fluid_change_rate" in new_values.keys():
-        cell_data.volume.nuclear = new_values["fluid_change_rate"]
-    if "cytoplasmic_biomass_change_rate" in new_values.keys():
-        cell_data.volume.cytoplasmic_biomass_change_rate = new_values[
-            "cytoplasmic_biomass_change_rate"
-        ]
-    if "nuclear_biomass_change_rate" in new_values.keys():
-        cell_data.volume.nuclear_biomass_change_rate = new_values[
-            "nuclear_biomass_change_rate"
-        ]
-    if "calcified_fraction" in new_values.keys():
-        cell_data.volume.calcified_fraction = new_values["calcified_fraction"]
-    if "calcification_rate" in new_values.keys():
-        cell_data.volume.calcification_rate = new_values["calcification_rate"]
-    if "relative_rupture_volume" in new_values.keys():
-        cell_data.volume.relative_rupture_volume = new_values["relative_rupture_volume"]
+    _update_fields(cell_data.volume, new_values, _VOLUME_KEYS)
 
 
 def update_motility_values(cell_data: dt.CellParameters, new_values: Dict[str, float]):
@@ -95,12 +116,7 @@ def update_motility_values(cell_data: dt.CellParameters, new_values: Dict[str, f
         of the CellParameters class. Keys should be the same as those in the XML file,
         but it is not required to include all the keys.
     """
-    if "speed" in new_values.keys():
-        cell_data.motility.speed = new_values["speed"]
-    if "persistence_time" in new_values.keys():
-        cell_data.motility.persistence_time = new_values["persistence_time"]
-    if "migration_bias" in new_values.keys():
-        cell_data.motility.migration_bias = new_values["migration_bias"]
+    _update_fields(cell_data.motility, new_values, _MOTILITY_KEYS)
 
 
 def update_mechanics_values(cell_data: dt.CellParameters, new_values: Dict[str, float]):
@@ -116,18 +132,7 @@ def update_mechanics_values(cell_data: dt.CellParameters, new_values: Dict[str,
         of the CellParameters class. Keys should be the same as those in the XML file,
         but it is not required to include all the keys.
     """
-    if "cell_cell_adhesion_strength" in new_values.keys():
-        cell_data.mechanics.cell_cell_adhesion_strength = new_values[
-            "cell_cell_adhesion_strength"
-        ]
-    if "cell_cell_repulsion_strength" in new_values.keys():
-        cell_data.mechanics.cell_cell_repulsion_strength = new_values[
-            "cell_cell_repulsion_strength"
-        ]
-    if "relative_maximum_adhesion_distance" in new_values.keys():
-        cell_data.mechanics.relative_maximum_adhesion_distance = new_values[
-            "relative_maximum_adhesion_distance"
-        ]
+    _update_fields(cell_data.mechanics, new_values, _MECHANICS_KEYS)
 
 
 @dataclass
@@ -169,16 +174,7 @@ def update_substance_values(substance: dt.Substance, new_values: Dict[str, float
         The new values to be written to the substance class. Keys should be the same
         as those in the XML file, but it is not required to include all the keys.
     """
-    if "diffusion_coefficient" in new_values.keys():
-        substance.diffusion_coefficient = new_values["diffusion_coefficient"]
-    if "decay_rate" in new_values.keys():
-        substance.decay_rate = new_values["decay_rate"]
-    if "initial_condition" in new_values.keys():
-        substance.initial_condition = new_values["initial_condition"]
-    if "dirichlet_boundary_condition" in new_values.keys():
-        substance.dirichlet_boundary_condition = new_values[
-            "dirichlet_boundary_condition"
-        ]
+    _update_fields(substance, new_values, _SUBSTANCE_KEYS)
 
 
 @dataclass
@@ -187,11 +183,7 @@ class MicroenvironmentUpdater(ParamsUpdater):
 
     def update(self, new_values: Dict[str, float]) -> None:
         """Updates the XML file with the values passed as input."""
-        substances = self.parser.read_me_params()
-        substance = [
-            substance
-            for substance in substances
-            if substance.name == self.substance_name
-        ][0]
+        # Only the selected substance is read from the (already parsed) XML tree
+        substance = self.parser.read_substance_params(self.substance_name)
         update_substance_values(substance=substance, new_values=new_values)
         self.parser.write_substance_params(substance)
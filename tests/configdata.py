@@ -2,7 +2,6 @@
 from pathlib import Path
 
 CONFIG_PATH = Path(__file__).resolve().parent / "data/settings_read_only.xml"
-WRITE_PATH = Path("test.xml")
 
 EXPECTED_DOMAIN_READ = {
     "x_min": -500.0,
@@ -236,166 +235,20 @@ EXPECTED_USER_PARAMETERS_WRITE = [
     {"name": "number_of_cells", "value": 5.0},
 ]
 
-EXPECTED_CELL_DATA_WRITE = {
+EXPECTED_CELL_DATA_READ = {
     "name": "default",
-    "cycle": {
-        "code": 6.0,
-        "phase_durations": [300.0, 480.0, 240.0, 60.0],
-        "phase_transition_rates": None,
-    },
-    "death": [
-        {
-            "code": 100.0,
-            "name": "apoptosis",
-            "death_rate": 5.31667e-05,
-            "phase_durations": [516.0],
-            "phase_transition_rates": None,
-            "unlysed_fluid_change_rate": 0.05,
-            "lysed_fluid_change_rate": 0.0,
-            "cytoplasmic_biomass_change_rate": 0.0166667,
-            "nuclear_biomass_change_rate": 0.00583333,
-            "calcification_rate": 0.0,
-            "relative_rupture_volume": 2.0,
-        },
-        {
-            "code": 101.0,
-            "name": "necrosis",
-            "death_rate": 0.0,
-            "phase_durations": [0.0, 86400.0],
-            "phase_transition_rates": None,
-            "unlysed_fluid_change_rate": 0.05,
-            "lysed_fluid_change_rate": 0.0,
-            "cytoplasmic_biomass_change_rate": 0.0166667,
-            "nuclear_biomass_change_rate": 0.00583333,
-            "calcification_rate": 0.0,
-            "relative_rupture_volume": 2.0,
-        },
-    ],
-    "volume": {
-        "total": 100.0,
-        "fluid_fraction": 0.75,
-        "nuclear": 540.0,
-        "fluid_change_rate": 0.05,
-        "cytoplasmic_biomass_change_rate": 0.0045,
-        "nuclear_biomass_change_rate": 0.0055,
-        "calcified_fraction": 0.0,
-        "calcification_rate": 0.0,
-        "relative_rupture_volume": 2.0,
-    },
-    "mechanics": {
-        "cell_cell_adhesion_strength": 4.0,
-        "cell_cell_repulsion_strength": 10.0,
-        "relative_maximum_adhesion_distance": 1.25,
-        "set_relative_equilibrium_distance": 1.8,
-        "set_absolute_equilibrium_distance": 15.12,
-    },
-    "motility": {
-        "speed": 5.0,
-        "persistence_time": 1.0,
-        "migration_bias": 0.5,
-        "motility_enabled": False,
-        "use_2d": True,
-        "chemotaxis_enabled": False,
-        "chemotaxis_substrate": "substrate",
-        "chemotaxis_direction": 1.0,
-    },
-    "secretion": [
-        {
-            "name": "substrate",
-            "secretion_rate": 0.0,
-            "secretion_target": 1.0,
-            "uptake_rate": 0.0,
-            "net_export_rate": 0.0,
-        },
-        {
-            "name": "oxygen",
-            "secretion_rate": 0.0,
-            "secretion_target": 1.0,
-            "uptake_rate": 0.0,
-            "net_export_rate": 0.0,
-        },
-    ],
-    "custom": [{"name": "sample", "value": 1.0}],
+    "cycle": EXPECTED_CYCLE_DURATIONS_READ,
+    "death": [EXPECTED_DEATH_APOPTOSIS_READ, EXPECTED_DEATH_NECROSIS_READ],
+    "volume": EXPECTED_VOLUME_READ,
+    "mechanics": EXPECTED_MECHANICS_READ,
+    "motility": EXPECTED_MOTILITY_READ,
+    "secretion": EXPECTED_SECRETION_READ,
+    "custom": EXPECTED_CUSTOM_READ,
 }
 
-EXPECTED_CELL_DATA_READ = {
-    "name": "default",
-    "cycle": {
-        "code": 6.0,
-        "phase_durations": [300.0, 480.0, 240.0, 60.0],
-        "phase_transition_rates": None,
-    },
-    "death": [
-        {
-            "code": 100.0,
-            "name": "apoptosis",
-            "death_rate": 5.31667e-05,
-            "phase_durations": [516.0],
-            "phase_transition_rates": None,
-            "unlysed_fluid_change_rate": 0.05,
-            "lysed_fluid_change_rate": 0.0,
-            "cytoplasmic_biomass_change_rate": 0.0166667,
-            "nuclear_biomass_change_rate": 0.00583333,
-            "calcification_rate": 0.0,
-            "relative_rupture_volume": 2.0,
-        },
-        {
-            "code": 101.0,
-            "name": "necrosis",
-            "death_rate": 0.0,
-            "phase_durations": [0.0, 86400.0],
-            "phase_transition_rates": None,
-            "unlysed_fluid_change_rate": 0.05,
-            "lysed_fluid_change_rate": 0.0,
-            "cytoplasmic_biomass_change_rate": 0.0166667,
-            "nuclear_biomass_change_rate": 0.00583333,
-            "calcification_rate": 0.0,
-            "relative_rupture_volume": 2.0,
-        },
-    ],
-    "volume": {
-        "total": 2494.0,
-        "fluid_fraction": 0.75,
-        "nuclear": 540.0,
-        "fluid_change_rate": 0.05,
-        "cytoplasmic_biomass_change_rate": 0.0045,
-        "nuclear_biomass_change_rate": 0.0055,
-        "calcified_fraction": 0.0,
-        "calcification_rate": 0.0,
-        "relative_rupture_volume": 2.0,
-    },
-    "mechanics": {
-        "cell_cell_adhesion_strength": 0.4,
-        "cell_cell_repulsion_strength": 10.0,
-        "relative_maximum_adhesion_distance": 1.25,
-        "set_relative_equilibrium_distance": 1.8,
-        "set_absolute_equilibrium_distance": 15.12,
-    },
-    "motility": {
-        "speed": 1.0,
-        "persistence_time": 1.0,
-        "migration_bias": 0.5,
-        "motility_enabled": False,
-        "use_2d": True,
-        "chemotaxis_enabled": False,
-        "chemotaxis_substrate": "substrate",
-        "chemotaxis_direction": 1.0,
-    },
-    "secretion": [
-        {
-            "name": "substrate",
-            "secretion_rate": 0.0,
-            "secretion_target": 1.0,
-            "uptake_rate": 0.0,
-            "net_export_rate": 0.0,
-        },
-        {
-            "name": "oxygen",
-            "secretion_rate": 0.0,
-            "secretion_target": 1.0,
-            "uptake_rate": 0.0,
-            "net_export_rate": 0.0,
-        },
-    ],
-    "custom": [{"name": "sample", "value": 1.0}],
+EXPECTED_CELL_DATA_WRITE = {
+    **EXPECTED_CELL_DATA_READ,
+    "volume": {**EXPECTED_VOLUME_READ, "total": 100.0},
+    "mechanics": {**EXPECTED_MECHANICS_READ, "cell_cell_adhesion_strength": 4.0},
+    "motility": {**EXPECTED_MOTILITY_READ, "speed": 5.0},
 }
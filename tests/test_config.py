@@ -1,6 +1,7 @@
 """Script to test the config module."""
 import unittest
 from shutil import copyfile
+from tempfile import TemporaryDirectory
 from xml.etree import ElementTree
 
 from physicool import config
@@ -10,14 +11,20 @@ from configdata import *
 
 
 class PhysiCellConfigTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Reads the read-only config file once (it is never modified by the tests)."""
+        cls.xml_data = config.ConfigFileParser(CONFIG_PATH)
+
     def setUp(self):
         """
         Creates a copy of the config file to be modified during the tests.
-        Reads the data in the files to ElementTree objects to be accessed by the class.
+        Reads the data in the copy to an ElementTree object to be accessed by the class.
         """
-        copyfile(CONFIG_PATH, WRITE_PATH)
-        self.xml_data = config.ConfigFileParser(CONFIG_PATH)
-        self.xml_write = config.ConfigFileParser(WRITE_PATH)
+        self.tmp_dir = TemporaryDirectory()
+        self.write_path = Path(self.tmp_dir.name) / "test.xml"
+        copyfile(CONFIG_PATH, self.write_path)
+        self.xml_write = config.ConfigFileParser(self.write_path)
 
     def test_get_cell_definition_list(self):
         """Asserts that the cell definitions extracted from the config file are correct."""
@@ -42,6 +49,19 @@ class PhysiCellConfigTest(unittest.TestCase):
         me_data = self.xml_data.read_me_params()
         self.assertEqual(expected_data, me_data)
 
+    def test_read_substance_params(self):
+        """Asserts that the data for a single substance is properly read."""
+        expected_data = dt.Substance(**EXPECTED_SUBSTANCE_READ)
+        substance_data = self.xml_data.read_substance_params(
+            EXPECTED_SUBSTANCE_READ["name"]
+        )
+        self.assertEqual(expected_data, substance_data)
+
+    def test_read_substance_params_invalid_name(self):
+        """Asserts that an error is raised for a substance that is not in the file."""
+        with self.assertRaises(ValueError):
+            self.xml_data.read_substance_params("not_a_substance")
+
     def test_read_cycle_durations_params(self):
         """Asserts that the <cycle> data for phase durations is properly read."""
         expected_data = dt.Cycle(**EXPECTED_CYCLE_DURATIONS_READ)
@@ -118,7 +138,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         domain_data.use_2d = False
         self.xml_write.write_domain_params(domain=domain_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         domain_data = pcxml.parse_domain(
             tree=new_tree,
             path="domain",
@@ -131,7 +151,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         overall_data.max_time = 120.0
         self.xml_write.write_overall_params(overall=overall_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         overall_data = pcxml.parse_overall(
             tree=new_tree,
             path="overall",
@@ -145,7 +165,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         substance_data[0].decay_rate = 1.0
         self.xml_write.write_substance_params(substance=substance_data[0])
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         substance_data = pcxml.parse_substance(
             tree=new_tree, path="microenvironment_setup", name="substrate"
         )
@@ -157,7 +177,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         cycle_data.phase_durations = [100.0, 10.0, 240.0, 60.0]
         self.xml_write.write_cycle_params(name="default", cycle=cycle_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         cycle_data = pcxml.parse_cycle(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/cycle",
@@ -170,7 +190,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         cycle_data.phase_transition_rates = [0.001, 0.001, 0.00416667, 0.0166667]
         self.xml_write.write_cycle_params(name="cancer", cycle=cycle_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         cycle_data = pcxml.parse_cycle(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='cancer']/phenotype/cycle",
@@ -184,7 +204,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         death_data[0].calcification_rate = 0.5
         self.xml_write.write_death_model_params(name="default", death=death_data[0])
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         death_data = pcxml.parse_death_model(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/death",
@@ -199,7 +219,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         death_data[0].calcification_rate = 0.5
         self.xml_write.write_death_params(name="default", death=death_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         death_data = pcxml.parse_death(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/death",
@@ -217,7 +237,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         volume_data.relative_rupture_volume = 3.0
         self.xml_write.write_volume_params(name="default", volume=volume_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         volume_data = pcxml.parse_volume(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/volume",
@@ -231,7 +251,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         mechanics_data.cell_cell_repulsion_strength = 100.0
         self.xml_write.write_mechanics_params(name="default", mechanics=mechanics_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         mechanics_data = pcxml.parse_mechanics(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/mechanics",
@@ -246,7 +266,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         motility_data.motility_enabled = True
         self.xml_write.write_motility_params(name="default", motility=motility_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         motility_data = pcxml.parse_motility(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/motility",
@@ -261,7 +281,7 @@ class PhysiCellConfigTest(unittest.TestCase):
             name="default", secretion=secretion_data[0], substance="substrate"
         )
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         secretion_data = pcxml.parse_secretion_substance(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/secretion",
@@ -275,7 +295,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         secretion_data[0].secretion_rate = 1.0
         self.xml_write.write_secretion_params(name="default", secretion=secretion_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         secretion_data = pcxml.parse_secretion_substance(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/secretion",
@@ -289,7 +309,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         custom_data[0].value = 5.0
         self.xml_write.write_custom_params(name="default", custom_data=custom_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         custom_data = pcxml.parse_custom(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/custom_data",
@@ -303,7 +323,7 @@ class PhysiCellConfigTest(unittest.TestCase):
         custom_data[1].value = 5.0
         self.xml_write.write_user_params(custom_data=custom_data)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = ElementTree.parse(self.write_path)
         custom_data = pcxml.parse_custom(
             tree=new_tree,
             path="user_parameters",
@@ -318,13 +338,13 @@ class PhysiCellConfigTest(unittest.TestCase):
         data.motility.speed = 5.0
         self.xml_write.write_cell_params(data)
 
-        new_tree = config.ConfigFileParser(WRITE_PATH)
+        new_tree = config.ConfigFileParser(self.write_path)
         data = new_tree.read_cell_data("default")
         self.assertEqual(EXPECTED_CELL_DATA_WRITE, data.dict())
 
     def tearDown(self) -> None:
-        """Deletes the tmp file that was created to test the writing functions."""
-        Path(WRITE_PATH).unlink()
+        """Deletes the tmp folder that was created to test the writing functions."""
+        self.tmp_dir.cleanup()
 
 
 if __name__ == "__main__":
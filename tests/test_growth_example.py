@@ -0,0 +1,40 @@
+"""Script to test the helper module of the growth example."""
+import importlib.util
+import unittest
+from pathlib import Path
+
+DATA_PATH = Path(__file__).resolve().parent / "data"
+EXAMPLE_PATH = (
+    Path(__file__).resolve().parents[1] / "examples" / "growth" / "physicool.py"
+)
+
+# The example module shares its name with the package, so it is loaded from its path
+spec = importlib.util.spec_from_file_location("growth_physicool", EXAMPLE_PATH)
+growth = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(growth)
+
+
+class TestGetCellData(unittest.TestCase):
+    def test_get_cell_data_all(self):
+        """Asserts that all the labelled output variables are read from the file."""
+        data = growth.get_cell_data(0, DATA_PATH, variables="all")
+        self.assertEqual(list(growth.DATA_LABELS), list(data.columns))
+        self.assertEqual(19, len(data))
+
+    def test_get_cell_data_variables(self):
+        """Asserts that only the selected output variables are read from the file."""
+        variables = ["ID", "position_x", "position_y"]
+        data = growth.get_cell_data(0, DATA_PATH, variables=variables)
+        self.assertEqual(variables, list(data.columns))
+        self.assertEqual(
+            [-450.0, -450.0], data.loc[0, ["position_x", "position_y"]].tolist()
+        )
+
+    def test_get_cell_data_wrong_variable(self):
+        """Asserts that an error is raised for variables that are not in the file."""
+        with self.assertRaises(ValueError):
+            growth.get_cell_data(0, DATA_PATH, variables=["not_a_variable"])
+
+
+if __name__ == "__main__":
+    unittest.main()
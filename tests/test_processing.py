@@ -12,14 +12,13 @@ DATA_PATH = Path(__file__).resolve().parent / "data"
 def make_df_from_positions(path: Path) -> pd.DataFrame:
     """Returns a Dataframe with the output structure based on the initial cell values (csv)."""
     data = pd.read_csv(
-        path, names=["position_x", "position_y", "position_z", "definition"]
+        path,
+        names=["position_x", "position_y", "position_z", "definition"],
+        usecols=["position_x", "position_y", "position_z"],
     )
-    data = data.drop(columns=["definition"])
-    data["ID"] = [float(i) for i in data.index]
+    # The columns are added in the order of the output data (no reindexing needed)
+    data.insert(0, "ID", np.arange(len(data), dtype=float))
     data["timestep"] = 0
-    data = data.reindex(
-        columns=["ID", "position_x", "position_y", "position_z", "timestep"]
-    )
 
     return data
 
@@ -46,6 +45,83 @@ class TestOutputProcessor(unittest.TestCase):
         )
         np.testing.assert_array_equal(np.asarray([19, 19]), number_of_cells)
 
+    def test_get_final_y_position(self):
+        """Asserts that the processing function reads the y coordinates at the last time point."""
+        expected_data = processing.get_cell_data(
+            timestep=1, variables=["position_y"], output_path=DATA_PATH, version="1.9.1"
+        )
+        final_y = processing.get_final_y_position(
+            output_path=DATA_PATH, version="1.9.1"
+        )
+        np.testing.assert_array_equal(expected_data["position_y"].values, final_y)
+        # The returned array owns its data (it is not a view of the cells matrix)
+        self.assertTrue(final_y.flags.owndata)
+
+
+class TestCellTrajectories(unittest.TestCase):
+    def test_get_cell_trajectories(self):
+        """Asserts that one trajectory is returned per cell, in order of appearance."""
+        trajectories = processing.get_cell_trajectories(
+            output_path=DATA_PATH, version="1.9.1"
+        )
+        data = pd.concat(
+            [
+                processing.get_cell_data(
+                    timestep=i,
+                    variables=["ID", "position_x", "position_y", "position_z"],
+                    output_path=DATA_PATH,
+                    version="1.9.1",
+                )
+                for i in range(2)
+            ]
+        )
+
+        self.assertEqual(len(data["ID"].unique()), len(trajectories))
+        for cell_id, trajectory in zip(data["ID"].unique(), trajectories):
+            expected_data = data[data["ID"] == cell_id][
+                ["position_x", "position_y", "position_z"]
+            ]
+            # The rows keep the index they had in each output file
+            pd.testing.assert_frame_equal(expected_data, trajectory)
+
+
+class TestErrorQuantification(unittest.TestCase):
+    def test_compute_sum_squared_error(self):
+        """Asserts that the error is the sum of the squared differences between datasets."""
+        model_data = np.array([[1.0, 2.0], [3.0, 4.0]])
+        reference_data = np.array([[0.0, 2.0], [1.0, 1.0]])
+        error = processing.compute_sum_squared_error(model_data, reference_data)
+        self.assertAlmostEqual(14.0, error)
+
+    def test_compute_sum_squared_error_series(self):
+        """Asserts that the error is computed for data stored in a Pandas Series."""
+        model_data = pd.Series([1.0, 2.0, 3.0])
+        reference_data = pd.Series([0.0, 2.0, 1.0])
+        error = processing.compute_sum_squared_error(model_data, reference_data)
+        self.assertAlmostEqual(5.0, error)
+
+    def test_compute_sum_squared_error_dataframe(self):
+        """Asserts that the error is computed for data stored in a Pandas DataFrame."""
+        model_data = pd.DataFrame([[1.0, 2.0], [3.0, 4.0]])
+        reference_data = pd.DataFrame([[0.0, 2.0], [1.0, 1.0]])
+        error = processing.compute_sum_squared_error(model_data, reference_data)
+        self.assertAlmostEqual(14.0, error)
+
+    def test_compute_sum_squared_error_positional(self):
+        """Asserts that Pandas inputs are compared by position, not by index label."""
+        model_data = pd.Series([1.0, 2.0, 3.0], index=[2, 1, 0])
+        reference_data = pd.Series([0.0, 2.0, 1.0])
+        error = processing.compute_sum_squared_error(model_data, reference_data)
+        self.assertAlmostEqual(5.0, error)
+
+    def test_compute_mean_squared_error_deprecated(self):
+        """Asserts that the old name warns and returns the sum of the squared errors."""
+        model_data = np.array([1.0, 2.0, 3.0])
+        reference_data = np.array([0.0, 2.0, 1.0])
+        with self.assertWarns(DeprecationWarning):
+            error = processing.compute_mean_squared_error(model_data, reference_data)
+        self.assertAlmostEqual(5.0, error)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -102,6 +102,10 @@ EXPECTED_VOLUME = Volume(
     relative_rupture_volume=2.0,
 )
 
+EXPECTED_VOLUME_2 = EXPECTED_VOLUME.copy(
+    update={"total": 3000.0, "fluid_change_rate": 0.1}
+)
+
 EXPECTED_MOTILITY = Motility(
     speed=5.0,
     persistence_time=10.0,
@@ -113,14 +117,18 @@ EXPECTED_MOTILITY = Motility(
     chemotaxis_direction=1.0,
 )
 
-EXPECTED_MOTILITY_2 = EXPECTED_MOTILITY.copy(deep=True)
-EXPECTED_MOTILITY_2.migration_bias = 0.5
+EXPECTED_MOTILITY_2 = EXPECTED_MOTILITY.copy(update={"migration_bias": 0.5})
 
 
 class UpdaterFunctionsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Validates the cell data once; each test updates its own deep copy of it."""
+        cls.cell_data = CellParameters(**CELL_DATA)
+
     def test_cycle_updater_function(self):
         """Asserts that the cycle parameters are correctly updated."""
-        data = CellParameters(**CELL_DATA)
+        data = self.cell_data.copy(deep=True)
         new_cycle_values = {
             "phase_0": 20.0,
             "phase_1": 180.0,
@@ -132,7 +140,7 @@ class UpdaterFunctionsTest(unittest.TestCase):
 
     def test_cycle_updater_function_wrong_length(self):
         """Asserts that the cycle parameters are correctly updated."""
-        data = CellParameters(**CELL_DATA)
+        data = self.cell_data.copy(deep=True)
         new_cycle_values = {
             "phase_0": 20.0,
             "phase_1": 180.0,
@@ -142,9 +150,16 @@ class UpdaterFunctionsTest(unittest.TestCase):
             ValueError, updaters.update_cycle_values, data, new_values=new_cycle_values
         )
 
+    def test_volume_updater_function(self):
+        """Asserts that the volume parameters are correctly updated."""
+        data = self.cell_data.copy(deep=True)
+        new_volume_values = {"total": 3000.0, "fluid_change_rate": 0.1}
+        updaters.update_volume_values(cell_data=data, new_values=new_volume_values)
+        self.assertEqual(EXPECTED_VOLUME_2, data.volume)
+
     def test_motility_updater_function(self):
         """Asserts that the motility parameters are correctly updated."""
-        data = CellParameters(**CELL_DATA)
+        data = self.cell_data.copy(deep=True)
         new_motility_values = {
             "speed": 5.0,
             "persistence_time": 10.0,
@@ -155,7 +170,7 @@ class UpdaterFunctionsTest(unittest.TestCase):
 
     def test_motility_updater_function_incomplete(self):
         """Asserts that the motility parameters are correctly updated when not all parameters are defined."""
-        data = CellParameters(**CELL_DATA)
+        data = self.cell_data.copy(deep=True)
         new_motility_values = {"speed": 5.0, "persistence_time": 10.0}
         updaters.update_motility_values(cell_data=data, new_values=new_motility_values)
         self.assertEqual(EXPECTED_MOTILITY_2, data.motility)
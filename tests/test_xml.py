@@ -1,6 +1,8 @@
 """Script to test the pcxml module of the PhysiCOOL package."""
 import unittest
-from shutil import copyfile
+from copy import deepcopy
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from xml.etree import ElementTree
 
 from physicool import pcxml
@@ -8,9 +10,10 @@ from configdata import *
 
 
 class ReadDataTest(unittest.TestCase):
-    def setUp(self):
-        """Reads the data into an ElementTree to be accessed by the class methods."""
-        self.tree = ElementTree.parse(CONFIG_PATH)
+    @classmethod
+    def setUpClass(cls):
+        """Reads the data once into an ElementTree to be accessed by the class methods."""
+        cls.tree = ElementTree.parse(CONFIG_PATH)
 
     def test_parse_domain(self):
         """Asserts that the <domain> data is correctly read."""
@@ -154,6 +157,14 @@ class ReadDataTest(unittest.TestCase):
         )
         self.assertEqual(EXPECTED_MOTILITY_READ, data)
 
+    def test_parse_motility_empty_substrate(self):
+        """Asserts that an empty chemotaxis <substrate> is read as None."""
+        tree = deepcopy(self.tree)
+        path = "cell_definitions/cell_definition[@name='default']/phenotype/motility"
+        tree.find(path + "/options/chemotaxis/substrate").text = None
+        data = pcxml.parse_motility(tree=tree, path=path)
+        self.assertIsNone(data["chemotaxis_substrate"])
+
     def test_parse_motility_wrong_path(self):
         """Asserts that an Exception is raised when the wrong path is passed."""
         self.assertRaises(ValueError, pcxml.parse_motility, self.tree, "domain")
@@ -219,30 +230,51 @@ class ReadDataTest(unittest.TestCase):
         )
         self.assertEqual(EXPECTED_USER_PARAMETERS_READ, data)
 
+    def test_parse_custom_whitespace_only(self):
+        """Asserts that variables holding only whitespace are skipped."""
+        tree = ElementTree.ElementTree(
+            ElementTree.fromstring(
+                "<custom_data><sample>1.0</sample><empty> </empty></custom_data>"
+            )
+        )
+        data = pcxml.parse_custom(tree=tree, path=".")
+        self.assertEqual([{"name": "sample", "value": 1.0}], data)
+
     def test_parse_custom_wrong_path(self):
         """Asserts that an Exception is raised when the wrong path is passed."""
         self.assertRaises(ValueError, pcxml.parse_custom, self.tree, "domain")
 
 
 class WriteDataTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Reads the data in the config file once to an ElementTree."""
+        cls.base_tree = ElementTree.parse(CONFIG_PATH)
+
     def setUp(self) -> None:
         """
-        Creates a copy of the config file to be modified during the tests.
-        Reads the data in the file to an ElementTree to be accessed by the class.
+        Creates a copy of the config tree to be modified during the tests.
+        Each test writes the modified tree to a tmp file to check the new values.
         """
-        copyfile(CONFIG_PATH, WRITE_PATH)
-        self.tree = ElementTree.parse(WRITE_PATH)
+        self.tree = deepcopy(self.base_tree)
+
+    def serialize_and_parse(self) -> ElementTree.ElementTree:
+        """Serializes the modified tree and parses it again, without writing a file."""
+        xml_string = ElementTree.tostring(self.tree.getroot())
+        return ElementTree.ElementTree(ElementTree.fromstring(xml_string))
 
     def test_write_domain(self):
-        """Asserts that the domain data is correctly written."""
+        """Asserts that the domain data is correctly written (to the tmp file)."""
         pcxml.write_domain(
             new_values=EXPECTED_DOMAIN_WRITE,
             tree=self.tree,
             path="domain",
         )
-        self.tree.write(WRITE_PATH)
+        with TemporaryDirectory() as tmp_dir:
+            write_path = Path(tmp_dir) / "test.xml"
+            self.tree.write(write_path)
+            new_tree = ElementTree.parse(write_path)
 
-        new_tree = ElementTree.parse(WRITE_PATH)
         domain_data = pcxml.parse_domain(
             tree=new_tree,
             path="domain",
@@ -255,6 +287,12 @@ class WriteDataTest(unittest.TestCase):
             ValueError, pcxml.write_domain, EXPECTED_DOMAIN_WRITE, self.tree, "overall"
         )
 
+    def test_write_domain_missing_path(self):
+        """Asserts that an Exception is raised when the path does not exist."""
+        self.assertRaises(
+            ValueError, pcxml.write_domain, EXPECTED_DOMAIN_WRITE, self.tree, "missing"
+        )
+
     def test_write_overall(self):
         """Asserts that the overall data is correctly written."""
         pcxml.write_overall(
@@ -262,9 +300,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="overall",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         overall_data = pcxml.parse_overall(
             tree=new_tree,
             path="overall",
@@ -285,9 +321,7 @@ class WriteDataTest(unittest.TestCase):
             path="microenvironment_setup",
             name="substrate",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         substance_data = pcxml.parse_substance(
             tree=new_tree, path="microenvironment_setup", name="substrate"
         )
@@ -322,9 +356,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/cycle",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         cycle_data = pcxml.parse_cycle(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/cycle",
@@ -338,9 +370,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="cell_definitions/cell_definition[@name='cancer']/phenotype/cycle",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         cycle_data = pcxml.parse_cycle(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='cancer']/phenotype/cycle",
@@ -374,9 +404,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/death",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         death_data = pcxml.parse_death_model(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/death",
@@ -401,9 +429,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/volume",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         volume_data = pcxml.parse_volume(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/volume",
@@ -417,9 +443,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/mechanics",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         mechanics_data = pcxml.parse_mechanics(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/mechanics",
@@ -433,9 +457,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/motility",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         motility_data = pcxml.parse_motility(
             tree=new_tree,
             path="cell_definitions/cell_definition[@name='default']/phenotype/motility",
@@ -450,9 +472,7 @@ class WriteDataTest(unittest.TestCase):
             path="cell_definitions/cell_definition[@name='default']/phenotype/secretion",
             name="substrate",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         secretion_data = pcxml.parse_secretion(
             tree=new_tree,
             path=f"cell_definitions/cell_definition[@name='default']/phenotype/secretion",
@@ -466,9 +486,7 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path=f"cell_definitions/cell_definition[@name='default']/custom_data",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         custom_data = pcxml.parse_custom(
             tree=new_tree,
             path=f"cell_definitions/cell_definition[@name='default']/custom_data",
@@ -482,19 +500,13 @@ class WriteDataTest(unittest.TestCase):
             tree=self.tree,
             path="user_parameters",
         )
-        self.tree.write(WRITE_PATH)
-
-        new_tree = ElementTree.parse(WRITE_PATH)
+        new_tree = self.serialize_and_parse()
         custom_data = pcxml.parse_custom(
             tree=new_tree,
             path=f"user_parameters",
         )
         self.assertEqual(EXPECTED_USER_PARAMETERS_WRITE, custom_data)
 
-    def tearDown(self) -> None:
-        """Deletes the tmp file that was created to test the writing functions."""
-        Path(WRITE_PATH).unlink()
-
 
 if __name__ == "__main__":
     unittest.main()